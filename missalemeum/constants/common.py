@@ -1,6 +1,7 @@
 import os
 import re
 from collections import defaultdict
+from datetime import timedelta
 
 THIS_DIR = os.path.dirname(os.path.realpath(__file__))
 RESOURCES_DIR = os.path.join(THIS_DIR, '..', '..', 'resources')
@@ -11,6 +12,7 @@ ORDO_DIR = os.path.join(RESOURCES_DIR, 'ordo')
 SUPPLEMENT_DIR = os.path.join(RESOURCES_DIR, 'supplement')
 
 SUNDAY = 6
+ONE_DAY = timedelta(days=1)
 LANGUAGE_LATIN = 'la'
 LANGUAGE_ENGLISH = 'en'
 LANGUAGES = {'en': 'English', 'pl': 'Polski'}
@@ -59,6 +61,7 @@ PATTERN_SANCTI_CLASS_1_OR_2 = re.compile(r'^sancti:.*:[12]:\w$')
 PATTERN_CLASS_1 = re.compile(r'^[a-z]+:.*:1:\w$')
 PATTERN_CLASS_2 = re.compile(r'^[a-z]+:.*:2:\w$')
 PATTERN_CLASS_3 = re.compile(r'^[a-z]+:.*:3:\w$')
+PATTERN_TEMPORA_WEEKDAY = re.compile(r'^.*-(\d+).*$')
 PATTERN_COMMEMORATION = 'wspomnienie'
 PATTERN_ALLELUIA = re.compile(r'allel[uú][ij]a.*', re.IGNORECASE)
 PATTERN_TRACT = re.compile(r'.*tra[ck]t.*', re.IGNORECASE)
@@ -990,7 +993,7 @@ TABLE_OF_PRECEDENCE = (
     TEMPORA_QUAD5_6,
     PATTERN_CLASS_3,
     # 4th class feasts
-    '.*'
+    re.compile(r'.*')
 )
 
 FEASTS_OF_JESUS_CLASS_1_AND_2 = (
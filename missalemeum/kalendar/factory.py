@@ -1,17 +1,32 @@
 # -*- coding: utf-8 -*-
 from collections import defaultdict
-from copy import copy
 from datetime import date, timedelta
-from typing import List, Tuple, Union
+from functools import lru_cache
+from typing import Dict, List, Tuple, Union
 
 from dateutil.easter import easter
 
 from constants import BLOCKS
-from constants.common import TEMPORA_NAT2_0, SANCTI_10_DU, LANGUAGE_ENGLISH, FERIA
-from kalendar.models import Calendar, Observance
+from constants.common import TEMPORA_NAT2_0, SANCTI_10_DU, LANGUAGE_ENGLISH, FERIA, ONE_DAY
+from kalendar.models import Calendar, Day, Observance
 from kalendar.rules import rules
 
 
+def _index_sancti(sancti: tuple) -> Dict[str, List[str]]:
+    """
+    Group sancti identifiers by the date they fall on, e.g. 'sancti:11-02m1:1:b' goes under '11-02'.
+    Identifiers are deduplicated here, preserving the order, so that each one yields exactly one `Observance`.
+    """
+    index = defaultdict(dict)
+    for observance_id in sancti:
+        index[observance_id.split(':')[1][:5]][observance_id] = None
+    return {date_id: list(observance_ids) for date_id, observance_ids in index.items()}
+
+
+SANCTI_BY_DATE: Dict[str, Dict[str, List[str]]] = {lang: _index_sancti(blocks.SANCTI)
+                                                   for lang, blocks in BLOCKS.items()}
+
+
 class MissalFactory:
     """
     MissalFactory instantiates `kalendar.models.Calendar` and fills it in with `kalendar.models.Day`
@@ -61,13 +76,12 @@ class MissalFactory:
         """
         Days ascribed to a specific date
         """
+        sancti = SANCTI_BY_DATE[self.lang]
         for date_, day in self.calendar.items():
-            date_id = date_.strftime("%m-%d")
-            days = [Observance(ii, date_, self.lang)
-                    for ii in self.blocks.SANCTI
-                    if ii.startswith("sancti:{}".format(date_id))]
+            days = [Observance(ii, date_, self.lang) for ii in sancti.get(f"{date_.month:02d}-{date_.day:02d}", ())]
             day.celebration.extend(days)
-            day.celebration.sort(reverse=True)
+            if len(day.celebration) > 1:
+                day.celebration.sort(reverse=True)
 
     def _insert_block(self, start_date: date, block: tuple, stop_date: date = None,
                       reverse: bool = False, overwrite: bool = True) -> None:
@@ -77,7 +91,7 @@ class MissalFactory:
         :type start_date: date object
         :param block: list of day identifiers in established order
         :type block: list of strings
-        :param stop_date: last date to insert block element
+        :param stop_date: last (or first, if `reverse`=True) date to insert block element
         :type stop_date: date object
         :param reverse: if False, identifiers will be put in days following `start_date` otherwise they'll
                         be put in leading up days
@@ -115,21 +129,24 @@ class MissalFactory:
         ...
         }
         """
+        step = ONE_DAY
         if reverse:
             block = reversed(block)
+            step = -ONE_DAY
         for ii, observance_ids in enumerate(block):
-            date_ = start_date + timedelta(days=ii if not reverse else -ii)
+            date_ = start_date + step * ii
+            # break on stop date
+            if stop_date is not None and (date_ < stop_date if reverse else date_ > stop_date):
+                break
             # skip on empty day in a block
             if not observance_ids:
                 continue
+            day = self.calendar.get_day(date_)
             # break on first non-empty day
-            if self.calendar.get_day(date_).celebration and not overwrite:
-                break
-            # break on stop date
-            if stop_date == date_ - timedelta(days=1):
+            if day.celebration and not overwrite:
                 break
-            self.calendar.get_day(date_).tempora = [Observance(obs_id, date_, self.lang) for obs_id in observance_ids]
-            self.calendar.get_day(date_).celebration = copy(self.calendar.get_day(date_).tempora)
+            day.tempora = [Observance(obs_id, date_, self.lang) for obs_id in observance_ids]
+            day.celebration = day.tempora[:]
 
     def _resolve_concurrency(self) -> None:
         """
@@ -138,35 +155,39 @@ class MissalFactory:
         """
         shifted_all = defaultdict(list)
         for date_, day in self.calendar.items():
-            celebration, commemoration, shifted = self._apply_rules(date_, shifted_all.pop(date_, []))
+            celebration, commemoration, shifted = self._apply_rules(date_, day, shifted_all.pop(date_, []))
             if not celebration:
                 feria = Observance(FERIA, date_, self.lang)
                 if day.tempora:
                     feria.colors = day.tempora[0].colors
                 celebration = [feria]
-            self.calendar.get_day(date_).celebration = celebration
-            self.calendar.get_day(date_).commemoration = commemoration
+            day.celebration = celebration
+            day.commemoration = commemoration
             for k, v in shifted:
                 shifted_all[k].extend(v)
 
-    def _apply_rules(self, date_: date, shifted: List[Observance]) \
+    def _apply_rules(self, date_: date, day: Day, shifted: List[Observance]) \
             -> Tuple[List[Observance], List[Observance], List[Observance]]:
+        # Built once for all the rules; a rule may only modify it right before returning its results
+        observances = day.celebration + shifted
         for rule in rules:
             results = rule(self.calendar,
                            date_,
-                           self.calendar.get_day(date_).tempora,
-                           self.calendar.get_day(date_).celebration + shifted,
+                           day.tempora,
+                           observances,
                            self.lang)
             if results is None:
                 continue
             return results
-        return self.calendar.get_day(date_).celebration, [], []
+        return day.celebration, [], []
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def calc_easter_sunday(year: int) -> date:
         return easter(year)
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def calc_holy_family(year: int) -> date:
         """
         Feast of the Holy Family - First Sunday after Epiphany (06 January).
@@ -186,6 +207,7 @@ class MissalFactory:
         return self.calc_easter_sunday(year) - timedelta(days=63)
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def calc_first_advent_sunday(year: int) -> date:
         """
         First Sunday of Advent - November 27 if it's Sunday, otherwise closest Sunday.
@@ -220,6 +242,7 @@ class MissalFactory:
         return self.calc_24_sunday_after_pentecost(year) - timedelta(days=1)
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def calc_ember_wednesday_september(year: int) -> date:
         """ Wednesday of the Ember Days of September.
 
@@ -227,16 +250,14 @@ class MissalFactory:
         of September according to John XXIII's motu proprio
         "Rubricarum instructum" of June 25 1960.
         """
-        d = date(year, 9, 1)
-        while d.month == 9:
-            # third Sunday
-            if d.weekday() == 6 and 15 <= d.day <= 21:
-                break
-            d += timedelta(days=1)
+        d = date(year, 9, 15)
+        # third Sunday is the first one falling on or after 15 September
+        d += timedelta(days=(6 - d.weekday()) % 7)
         # Wednesday after third Sunday
         return d + timedelta(days=3)
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def calc_holy_name(year: int) -> date:
         """ The Feast of the Holy Name of Jesus.
 
@@ -244,33 +265,28 @@ class MissalFactory:
         1st, 6th or 7th January, the feast is kept on 2nd January.
         """
         d = date(year, 1, 1)
-        while d.day <= 7:
-            wd = d.weekday()
-            if d.day in (1, 6, 7) and wd == 6:
-                return date(year, 1, 2)
-            if wd == 6:
-                return d
-            d += timedelta(days=1)
+        d += timedelta(days=(6 - d.weekday()) % 7)
+        if d.day in (1, 6, 7):
+            return date(year, 1, 2)
+        return d
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def calc_christ_king(year: int) -> date:
         """
         The Feast of Christ the King, last Sunday of October.
         """
         d = date(year, 10, 31)
-        while d.month == 10:
-            if d.weekday() == 6:
-                return d
-            d -= timedelta(days=1)
+        return d - timedelta(days=(d.weekday() + 1) % 7)
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def calc_sunday_christmas_octave(year: int) -> Union[date, None]:
         """
         Sunday within the Octave of Christmas, falls between Dec 26 and Dec 31
         """
         d = date(year, 12, 26)
-        while d.year == year:
-            if d.weekday() == 6:
-                return d
-            d += timedelta(days=1)
+        d += timedelta(days=(6 - d.weekday()) % 7)
+        if d.year == year:
+            return d
         return None
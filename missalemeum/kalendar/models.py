@@ -2,9 +2,9 @@ import datetime
 import importlib
 import logging
 import re
-from collections import OrderedDict
 from copy import copy
-from datetime import date, timedelta
+from datetime import date
+from itertools import chain
 from typing import ItemsView, List, Tuple, Union
 
 from constants.common import (TEMPORA_C_10A, TEMPORA_C_10B, TEMPORA_C_10C, TEMPORA_C_10PASC, TEMPORA_C_10T,
@@ -18,7 +18,7 @@ from constants.common import (TEMPORA_C_10A, TEMPORA_C_10B, TEMPORA_C_10C, TEMPO
                               COMMUNIO,
                               TEMPORA_NAT2_0, SANCTI_01_01, PREFATIO_COMMUNIS, TEMPORA_PASC5_0,
                               TEMPORA_PASC5_4,
-                              TEMPORA_PENT01_0A, FERIA)
+                              TEMPORA_PENT01_0A, FERIA, PATTERN_TEMPORA_WEEKDAY, ONE_DAY)
 from propers.models import Proper, ProperConfig
 from propers.parser import ProperParser
 from utils import get_custom_preface, match
@@ -51,8 +51,7 @@ class Observance:
         which is third feria day (Wednesday) in second week after Epiphany, vestment color is green
       'sancti:11-19:4:w' - means a fixed day of fourth class falling on 19 Nov, color is white
     """
-
-    lang = None
+    __slots__ = ('date', 'lang', 'flexibility', 'name', 'rank', 'colors', 'id', 'title', 'weekday', 'priority')
 
     def __init__(self, observance_id: str, date_: date, lang: str):
         """ Build an Observance out of identifier and calendar date
@@ -76,7 +75,7 @@ class Observance:
         self.id: str = ':'.join((self.flexibility, self.name, str(self.rank), color))
         self.title: str = translation.TITLES.get(observance_id)
         if flexibility == TYPE_TEMPORA and observance_id not in (TEMPORA_C_10A, TEMPORA_C_10B, TEMPORA_C_10C, TEMPORA_C_10PASC, TEMPORA_C_10T):
-            self.weekday = WEEKDAY_MAPPING[re.sub(r'^.*-(\d+).*$', '\\1', name)]
+            self.weekday = WEEKDAY_MAPPING[PATTERN_TEMPORA_WEEKDAY.sub('\\1', name)]
         else:
             self.weekday = self.date.weekday()
         self.priority = self._calc_priority()
@@ -102,7 +101,7 @@ class Observance:
         for case in TEMPORA_RANK_MAP:
             if self.date.month == case['month']\
                     and self.date.day == case['day']\
-                    and re.match(case['pattern'], observance_id):
+                    and case['pattern'].match(observance_id):
                 return case['rank']
         return original_rank
 
@@ -111,7 +110,11 @@ class Observance:
         Calculate priority according to the Precedence Table.
         """
         for priority, pattern in enumerate(TABLE_OF_PRECEDENCE):
-            if re.match(pattern, self.id):
+            # Plain identifiers in the table are literal prefixes, no need to run them through `re`
+            if isinstance(pattern, str):
+                if self.id.startswith(pattern):
+                    return priority
+            elif pattern.match(self.id):
                 return priority
 
     def _adjust_sunday_shifted_from_post_epiphany(self, propers: Tuple['Proper', 'Proper']) \
@@ -244,7 +247,7 @@ class Day:
         while not (date_.weekday() == SUNDAY) and not (date_.month == 1 and date_.day == 6):
             if date_ == datetime.date(self.date.year, 1, 1):
                 break
-            date_ = date_ - datetime.timedelta(days=1)
+            date_ = date_ - ONE_DAY
         day: Day = self.calendar.get_day(date_)
         # Handling exceptions
         if day.celebration[0].id == TEMPORA_EPI1_0:
@@ -288,7 +291,7 @@ class Calendar:
     """
     Class representing a Calendar.
 
-    Internally it keeps the data in an ordered dict of `Days`s where each key is a `date` object and value
+    Internally it keeps the data in a dict (insertion-ordered) of `Days`s where each key is a `date` object and value
     is a `Day` containing `Observance` objects organized inside Day's members. Example:
 
     {
@@ -315,14 +318,12 @@ class Calendar:
         """ Build a calendar and fill it in with empty `Day` objects
         """
         self.lang = lang
-        self._container = OrderedDict()
+        self._container = {}
         self._build_empty_calendar(year)
 
     def _build_empty_calendar(self, year: int) -> None:
-        date_ = date(year, 1, 1)
-        while date_.year == year:
-            self._container[date_] = Day(date_, self)
-            date_ += timedelta(days=1)
+        start, end = date(year, 1, 1).toordinal(), date(year, 12, 31).toordinal()
+        self._container.update({date_: Day(date_, self) for date_ in map(date.fromordinal, range(start, end + 1))})
 
     def get_day(self, date_: datetime.date) -> Day:
         return self._container.get(date_)
@@ -336,8 +337,9 @@ class Calendar:
         :rtype: list(datetime, list)
         """
         for date_, day in self._container.items():
-            if observance_id in [ii.id for ii in day.all]:
-                return date_, day
+            for observance in chain(day.tempora, day.celebration, day.commemoration):
+                if observance.id == observance_id:
+                    return date_, day
 
     def items(self) -> ItemsView[date, Day]:
         return self._container.items()
@@ -15,7 +15,7 @@ Each rule returns a tuple consisting of three lists:
 
 from calendar import isleap
 from copy import copy
-from datetime import date, timedelta
+from datetime import date
 from typing import List
 
 from constants.common import (TEMPORA_C_10A, TEMPORA_C_10B, TEMPORA_C_10C, TEMPORA_C_10PASC, TEMPORA_C_10T,
@@ -33,7 +33,7 @@ from constants.common import (TEMPORA_C_10A, TEMPORA_C_10B, TEMPORA_C_10C, TEMPO
                               TEMPORA_QUAD6_4, TEMPORA_QUAD6_5,
                               TEMPORA_QUAD6_6, TEMPORA_QUADP3_3,
                               SANCTI_09_29, PATTERN_SANCTI_CLASS_4, PATTERN_LENT, PATTERN_SANCTI, SUNDAY,
-                              PATTERN_TEMPORA_CLASS_4)
+                              PATTERN_TEMPORA_CLASS_4, ONE_DAY)
 from kalendar.models import Calendar, Observance
 from utils import match
 
@@ -147,7 +147,7 @@ def rule_shift_conflicting_1st_class_feasts(
     def _calc_target_date():
         target_date = copy(date_)
         while target_date.year == date_.year:
-            target_date = target_date + timedelta(days=1)
+            target_date = target_date + ONE_DAY
             all_ranks = set([ld.rank for ld in calendar.get_day(target_date).all])
             if not {1, 2}.intersection(all_ranks):
                 return target_date
@@ -154,6 +154,8 @@ def test_given_date_contains_proper_day_ids(date_, tempora, celebration, commemo
     ((2018, 12, 24), [c.PATTERN_ADVENT]),
     ((2018, 12, 25), [c.PATTERN_ADVENT]),
     ((2018, 12, 26), [c.PATTERN_ADVENT]),
+    ((2017, 12, 24), [c.PATTERN_ADVENT]),  # 4th Sunday of Advent would fall on Dec 24
+    ((2021, 12, 24), [c.PATTERN_ADVENT]),
     ((2018, 1, 14), [c.SANCTI_01_14]),
     ((2018, 1, 21), [c.SANCTI_01_21]),
     ((2018, 1, 21), [c.SANCTI_01_21]),